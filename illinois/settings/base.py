@@ -115,4 +115,29 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # Because we're using a project-level /static folder:
 STATICFILES_DIRS = [BASE_DIR / "illinois/ui-ux/static"]
 STATIC_ROOT = BASE_DIR / "illinois/ui-ux/staticfiles"
-STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.ManifestStaticFilesStorage'
\ No newline at end of file
+STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.ManifestStaticFilesStorage'
+
+# New addition/changes: caching
+# Where cache.get()/cache.set() and @cache_page store things.
+# LocMemCache keeps the cache in each worker's memory (nothing to install).
+# That also means each worker process has its OWN cache: when students/signals.py
+# deletes a key after a save, only the worker that handled the save forgets it.
+# The other workers keep their copy until its timeout runs out, which is why the
+# cached counts use short timeouts (30-60 seconds).
+# For several workers or servers, switch the BACKEND to a shared cache such as
+# 'django.core.cache.backends.redis.RedisCache' with LOCATION 'redis://127.0.0.1:6379';
+# then a delete clears the key for everyone.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'illinois-cache',
+    }
+}
+
+# Seconds that cached pages/images (e.g. @cache_page views) stay valid.
+DEFAULT_CACHE_TIMEOUT = 300
+
+# Load matplotlib and create the chart figures when the app starts (students/apps.py),
+# instead of on the first chart request. The import takes about half a second, so it
+# is off for development (runserver restarts often) and on in production.py.
+PRELOAD_CHARTS = False
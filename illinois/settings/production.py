@@ -5,6 +5,10 @@ from .base import *
 
 DEBUG = False
 
+# Pay the matplotlib import at startup, not on the first chart request (see base.py).
+# With gunicorn --preload, this happens once in the parent process and the workers share it.
+PRELOAD_CHARTS = True
+
 # Replace it with your name:
 ALLOWED_HOSTS = ['localhost', '127.0.0.1']
 
@@ -18,10 +18,20 @@ class StudentAdmin(admin.ModelAdmin):
     search_fields = ("first_name", "last_name", "email", "section__code")
     list_filter   = ("section",)
     ordering      = ("last_name", "first_name")
+    # "section" in list_display would otherwise fetch one Section per row (N+1).
+    list_select_related = ("section",)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("section")
 
 @admin.register(Enrollment)
 class EnrollmentAdmin(admin.ModelAdmin):
     list_display  = ("enroll_id", "student", "section", "is_active", "enrolled_on")
     search_fields = ("student__first_name", "student__last_name", "section__code")
     list_filter   = ("section", "is_active")
-    ordering      = ("-enroll_id",)   # newest first
\ No newline at end of file
+    ordering      = ("-enroll_id",)   # newest first
+    # "student" and "section" in list_display: join both in the changelist SELECT.
+    list_select_related = ("student", "section")
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("student", "section")
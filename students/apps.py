@@ -1,6 +1,16 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class StudentsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'students'
+
+    def ready(self):
+        # Connect the cache-invalidation receivers in students/signals.py
+        from . import signals  # noqa: F401
+
+        # Optionally import matplotlib now, so no visitor waits for it (settings.PRELOAD_CHARTS)
+        if getattr(settings, "PRELOAD_CHARTS", False):
+            from .views import preload_charts
+            preload_charts()
@@ -10,12 +10,20 @@ class FeedbackForm(forms.Form):
     feedback = forms.CharField(widget=forms.Textarea, label="Comments")
 
 # New addition/change
-from students.models import Student
+from students.models import Student, Section
 class StudentForm(forms.ModelForm):
     class Meta:
         model = Student
         fields = "__all__"  # auto-create fields from model
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The section <select> only needs what Section.__str__ prints (code + term),
+        # so don't load every column of every Section for the dropdown.
+        self.fields["section"].queryset = (
+            Section.objects.only("section_id", "code", "term").order_by("code")
+        )
+
     def clean_first_name(self):
         return self.cleaned_data["first_name"].strip()
 
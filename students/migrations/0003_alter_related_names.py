@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0002_alter_enrollment_options_alter_section_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='enrollment',
+            name='section',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='enrollments_related_name', to='students.section'),
+        ),
+        migrations.AlterField(
+            model_name='enrollment',
+            name='student',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='enrollments_related_name', to='students.student'),
+        ),
+        migrations.AlterField(
+            model_name='student',
+            name='section',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='section_related_name', to='students.section'),
+        ),
+    ]
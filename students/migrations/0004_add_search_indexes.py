@@ -0,0 +1,32 @@
+# Search/ordering indexes for Student and Section.
+# Built with CREATE INDEX CONCURRENTLY on PostgreSQL (see students/operations.py),
+# which cannot run inside a transaction, hence atomic = False.
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+import students.operations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('students', '0003_alter_related_names'),
+    ]
+
+    operations = [
+        students.operations.AddIndexConcurrently(
+            model_name='section',
+            index=models.Index(fields=['term'], name='section_term_idx'),
+        ),
+        students.operations.AddIndexConcurrently(
+            model_name='student',
+            index=models.Index(fields=['last_name', 'first_name'], name='student_last_first_idx'),
+        ),
+        students.operations.AddIndexConcurrently(
+            model_name='student',
+            index=models.Index(django.db.models.functions.text.Lower('first_name'), name='student_first_lower_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:34
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_section_codes(apps, schema_editor):
+    # Fill section_code for the students that already exist.
+    Section = apps.get_model('students', 'Section')
+    Student = apps.get_model('students', 'Student')
+    Student.objects.update(
+        section_code=Subquery(Section.objects.filter(pk=OuterRef('section_id')).values('code')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0004_add_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='student',
+            name='section_code',
+            field=models.CharField(db_index=True, default='', editable=False, max_length=10),
+        ),
+        migrations.RunPython(copy_section_codes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# PostgreSQL only: trigram GIN indexes for the student name searches.
+#
+# api_students, StudentsAPI, StudentListView and the admin search use
+# first_name/last_name/nickname__icontains, which PostgreSQL runs as ILIKE '%q%'.
+# A plain B-tree index cannot help with a leading '%', but a pg_trgm GIN index can,
+# so those searches stop scanning the whole table. The queries themselves do not change.
+#
+# On SQLite (development) this migration does nothing. The indexes are built
+# CONCURRENTLY so writes are not blocked, which cannot run in a transaction,
+# hence atomic = False.
+
+from django.db import migrations
+
+TRIGRAM_COLUMNS = ['first_name', 'last_name', 'nickname']
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for column in TRIGRAM_COLUMNS:
+        schema_editor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "student_{column}_trgm" '
+            f'ON "students_student" USING gin ("{column}" gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for column in TRIGRAM_COLUMNS:
+        schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "student_{column}_trgm"')
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('students', '0005_student_section_code'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
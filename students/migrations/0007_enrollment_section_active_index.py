@@ -0,0 +1,22 @@
+# Built with CREATE INDEX CONCURRENTLY on PostgreSQL (see students/operations.py),
+# which cannot run inside a transaction, hence atomic = False.
+
+from django.db import migrations, models
+
+import students.operations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('students', '0006_student_name_trigram_indexes'),
+    ]
+
+    operations = [
+        students.operations.AddIndexConcurrently(
+            model_name='enrollment',
+            index=models.Index(fields=['section', 'is_active'], name='enroll_section_active_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Built with CREATE INDEX CONCURRENTLY on PostgreSQL (see students/operations.py),
+# which cannot run inside a transaction, hence atomic = False.
+
+from django.db import migrations, models
+
+import students.operations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('students', '0007_enrollment_section_active_index'),
+    ]
+
+    operations = [
+        students.operations.AddIndexConcurrently(
+            model_name='student',
+            index=models.Index(fields=['section', 'last_name', 'first_name'], name='stu_sec_last_first_idx'),
+        ),
+    ]
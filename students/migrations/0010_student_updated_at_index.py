@@ -0,0 +1,22 @@
+# Built with CREATE INDEX CONCURRENTLY on PostgreSQL (see students/operations.py),
+# which cannot run inside a transaction, hence atomic = False.
+
+from django.db import migrations, models
+
+import students.operations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('students', '0009_student_updated_at'),
+    ]
+
+    operations = [
+        students.operations.AddIndexConcurrently(
+            model_name='student',
+            index=models.Index(fields=['updated_at'], name='student_updated_at_idx'),
+        ),
+    ]
@@ -2,6 +2,7 @@
 # New changes: Added get_absolute_url method in the Student model.
 
 from django.db import models
+from django.db.models.functions import Lower
 from django.urls import reverse
 
 
@@ -15,6 +16,10 @@ class Section(models.Model):
 
     class Meta:
         ordering = ["code"]
+        # "code" is unique, so it already has an index; "term" is grouped/filtered on in reports.
+        indexes = [
+            models.Index(fields=["term"], name="section_term_idx"),
+        ]
 
     def __str__(self):
         return f"{self.code} ({self.term or '—'})"
@@ -32,6 +37,27 @@ class Student(models.Model):
         on_delete=models.PROTECT,   # start safe; try changing this to CASCADE after class
         related_name="section_related_name",          # I changed this name in week 5
     )
+    # Copy of section.code, kept in sync by save() below and by a Section post_save
+    # receiver in students/signals.py. Lets the student API show the section code
+    # without joining the Section table.
+    section_code = models.CharField(max_length=10, db_index=True, editable=False, default="")
+    # Set to "now" on every save(). The CSV export uses the newest one as its Last-Modified.
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def save(self, *args, **kwargs):
+        self.section_code = self.section.code
+        # save(update_fields=[...]) writes only the listed columns. Add the ones this
+        # method (and auto_now) change, or they would silently keep their old values:
+        #   - section_code whenever the section is saved,
+        #   - updated_at always (the exports' ETag/Last-Modified read it).
+        update_fields = kwargs.get("update_fields")
+        if update_fields:
+            update_fields = set(update_fields)
+            if update_fields & {"section", "section_id"}:
+                update_fields.add("section_code")
+            update_fields.add("updated_at")
+            kwargs["update_fields"] = update_fields
+        super().save(*args, **kwargs)
 
     ####################################################################################################################################
     # NEW:
@@ -50,6 +76,18 @@ class Student(models.Model):
                 name="uniq_student_name_in_section",
             )
         ]
+        # "email" (unique) and "section" (foreign key) are indexed automatically.
+        indexes = [
+            # Backs the default ordering and last/first name lookups.
+            models.Index(fields=["last_name", "first_name"], name="student_last_first_idx"),
+            # Case-insensitive first name search (functional index).
+            models.Index(Lower("first_name"), name="student_first_lower_idx"),
+            # Students of one section in name order (filter by section + default ordering).
+            models.Index(fields=["section", "last_name", "first_name"], name="stu_sec_last_first_idx"),
+            # Newest updated_at (Max) and the row count for the export ETag, read from this
+            # small index instead of the whole table (students/services/exports.py).
+            models.Index(fields=["updated_at"], name="student_updated_at_idx"),
+        ]
 
     def __str__(self):
         base = f"{self.last_name}, {self.first_name}"
@@ -84,6 +122,10 @@ class Enrollment(models.Model):
                 name="uniq_enrollment_per_student_per_section",
             )
         ]
+        # Backs the per-section enrollment counts (all / active) in the views.
+        indexes = [
+            models.Index(fields=["section", "is_active"], name="enroll_section_active_idx"),
+        ]
 
     def __str__(self):
         return f"Enrollment(student={self.student_id}, section={self.section_id})"
@@ -0,0 +1,35 @@
+# New file: students/operations.py
+# Custom migration operations used by students/migrations/.
+
+from django.db import migrations
+
+
+class AddIndexConcurrently(migrations.AddIndex):
+    """
+    AddIndex that builds the index with CREATE INDEX CONCURRENTLY on PostgreSQL,
+    so writes to the table are not blocked while the index is built.
+
+    On other databases (SQLite in development) it behaves like a normal AddIndex.
+    django.contrib.postgres has its own AddIndexConcurrently, but importing it
+    needs psycopg, which we do not install for SQLite.
+
+    PostgreSQL cannot run CONCURRENTLY inside a transaction, so the migration
+    that uses this operation must set `atomic = False`.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return super().database_forwards(app_label, schema_editor, from_state, to_state)
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.add_index(model, self.index, concurrently=True)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return super().database_backwards(app_label, schema_editor, from_state, to_state)
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.remove_index(model, self.index, concurrently=True)
+
+    def describe(self):
+        return super().describe() + " (concurrently on PostgreSQL)"
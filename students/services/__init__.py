@@ -0,0 +1,3 @@
+# New package: students/services/
+# Plain functions that build the data our views need, so several views
+# (HTML pages, JSON APIs, charts) can share one query instead of each writing its own.
@@ -0,0 +1,42 @@
+# New file: students/services/enrollments.py
+# Enrollment numbers per section, shared by the JSON API, the reports page and the chart.
+
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from students.models import Enrollment, Section
+
+
+def enrollment_count(**filters):
+    """
+    Number of enrollments of each Section, for use in Section.objects.annotate(...).
+
+    Written as a correlated subquery instead of Count("enrollments_related_name"):
+    joining enrollments next to other joins (like students) multiplies the rows and
+    inflates the counts. The subquery counts each section's enrollments on its own,
+    using the (section, is_active) index on Enrollment.
+    Extra keyword arguments filter the enrollments, e.g. enrollment_count(is_active=True).
+    """
+    per_section = (
+        Enrollment.objects
+        .filter(section=OuterRef("pk"), **filters)
+        .order_by()              # drop Enrollment's default ordering (it would join Student)
+        .values("section")       # GROUP BY section ...
+        .annotate(c=Count("*"))  # ... and count the rows
+        .values("c")
+    )
+    # A section with no enrollments gives no row → NULL; Coalesce turns that into 0.
+    return Coalesce(Subquery(per_section), 0)
+
+
+def get_enrollments_per_section():
+    """
+    All vs. active enrollments for every section, ordered by section code:
+      [{"code": "INFO-390-MG", "n_all": 2, "n_active": 2}, ...]
+    """
+    return list(
+        Section.objects
+        .annotate(n_all=enrollment_count(), n_active=enrollment_count(is_active=True))
+        .values("code", "n_all", "n_active")
+        .order_by("code")
+    )
@@ -0,0 +1,31 @@
+# New file: students/services/exports.py
+# The student downloads (CSV and JSON): which rows, in which order, and a cheap
+# "version" of that data so both exports can answer 304 Not Modified.
+
+from django.db.models import Count, Max
+
+from students.models import Student
+
+# Columns of both export files, in this order. section_code is the copy of
+# section.code stored on Student, so neither export joins the Section table.
+STUDENT_EXPORT_FIELDS = ("student_id", "first_name", "last_name", "email", "section_code")
+
+
+def get_students_export_rows():
+    """
+    Every student as a tuple of STUDENT_EXPORT_FIELDS, sorted by last name, then first name:
+      (1, "Alice", "Johnson", "alice@example.com", "INFO-390-MG")
+    The queryset is lazy; the views stream it with .iterator() instead of loading it all.
+    """
+    return Student.objects.values_list(*STUDENT_EXPORT_FIELDS).order_by("last_name", "first_name")
+
+
+def get_students_export_version():
+    """
+    {"n": <number of students>, "last": <newest Student.updated_at, or None>}
+    One aggregate query. Any save moves "last" and any add/delete changes "n",
+    so together they name the version of the data an export is built from.
+    COUNT(*) (not COUNT(student_id)) lets the database answer both from the
+    updated_at index alone, without reading the table.
+    """
+    return Student.objects.aggregate(n=Count("*"), last=Max("updated_at"))
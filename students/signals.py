@@ -0,0 +1,59 @@
+# New file: students/signals.py
+# Cache invalidation: whenever a Student, Section or Enrollment is saved or deleted,
+# throw away the cached values that were computed from those tables.
+# These receivers are connected in StudentsConfig.ready() (students/apps.py).
+
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from students.models import Enrollment, Section, Student
+
+# Section stats shown on the student list page (students/views.py → StudentListView)
+STUDENT_LIST_STATS_CACHE_KEY = "student_list_aggs_v1"
+# Table totals shown on the same page
+STUDENT_COUNT_CACHE_KEY = "student_count_v1"
+ENROLLMENT_COUNT_CACHE_KEY = "enrollment_count_v1"
+# Name of the {% cache %} block around the tables in templates/students/reports.html
+REPORTS_TABLES_FRAGMENT = "reports_tables"
+
+
+@receiver([post_save, post_delete], sender=Student)
+@receiver([post_save, post_delete], sender=Section)
+@receiver([post_save, post_delete], sender=Enrollment)
+def clear_student_list_stats(sender, **kwargs):
+    cache.delete(STUDENT_LIST_STATS_CACHE_KEY)
+
+
+@receiver([post_save, post_delete], sender=Student)
+@receiver([post_save, post_delete], sender=Section)
+@receiver([post_save, post_delete], sender=Enrollment)
+def clear_reports_tables(sender, **kwargs):
+    cache.delete(make_template_fragment_key(REPORTS_TABLES_FRAGMENT))
+
+
+@receiver(post_save, sender=Student)
+@receiver(post_delete, sender=Student)
+def clear_student_count(sender, created=True, **kwargs):
+    # An edit (save of an existing row) does not change the count.
+    if created:
+        cache.delete(STUDENT_COUNT_CACHE_KEY)
+
+
+@receiver(post_save, sender=Enrollment)
+@receiver(post_delete, sender=Enrollment)
+def clear_enrollment_count(sender, created=True, **kwargs):
+    if created:
+        cache.delete(ENROLLMENT_COUNT_CACHE_KEY)
+
+
+# Student.section_code is a copy of Section.code; when a section's code changes,
+# update the copy on all of its students (one UPDATE query).
+# update() skips save(), so auto_now does not run: set updated_at ourselves.
+@receiver(post_save, sender=Section)
+def sync_student_section_code(sender, instance, **kwargs):
+    Student.objects.filter(section=instance).exclude(section_code=instance.code).update(
+        section_code=instance.code, updated_at=timezone.now(),
+    )
@@ -1,3 +1,204 @@
+import csv
+import io
+import json
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.urls import reverse
+
+from students import views
+from students.models import Enrollment, Section, Student
+
+
+class StudentsTestCase(TestCase):
+    """Starts every test with an empty cache (charts and counts are cached between requests)."""
+
+    def setUp(self):
+        cache.clear()
+        self.section = Section.objects.create(code="INFO-390", name="Intro", term="Fall 2025")
+
+    def add_student(self, n, **fields):
+        values = {
+            "first_name": f"First{n}",
+            "last_name": f"Last{n:03d}",
+            "email": f"student{n}@example.com",
+            "section": self.section,
+        }
+        values.update(fields)
+        return Student.objects.create(**values)
+
+    def download(self, url_name, **headers):
+        response = self.client.get(reverse(url_name), **headers)
+        body = b"".join(response.streaming_content) if response.streaming else response.content
+        return response, body
+
+
+class CsvExportTests(StudentsTestCase):
+    def expected_rows(self):
+        rows = Student.objects.values_list(
+            "student_id", "first_name", "last_name", "email", "section_code"
+        ).order_by("last_name", "first_name")
+        return [["student_id", "first_name", "last_name", "email", "section_code"]] + [
+            [str(value) for value in row] for row in rows
+        ]
+
+    def test_matches_csv_writer_for_plain_and_quoted_rows(self):
+        self.add_student(1)
+        self.add_student(2, first_name='Al, "Bo"')     # comma and quotes
+        self.add_student(3, last_name="Line\nBreak")   # newline
+        self.add_student(4, first_name="Carriage\rReturn")
+
+        # The Python export (on PostgreSQL the view would use COPY, tested below)
+        with mock.patch.object(views, "can_copy_students_csv", return_value=False):
+            response, body = self.download("export-students-csv")
+
+        self.assertEqual(response.status_code, 200)
+        expected = io.StringIO()
+        csv.writer(expected).writerows(self.expected_rows())
+        self.assertEqual(body.decode(), expected.getvalue())
+        self.assertEqual(list(csv.reader(io.StringIO(body.decode()))), self.expected_rows())
+
+
+    @skipUnless(connection.vendor == "postgresql", "COPY ... TO STDOUT needs PostgreSQL")
+    def test_postgresql_copy_has_the_same_rows(self):
+        self.add_student(1)
+        self.add_student(2, first_name='Al, "Bo"')
+        self.add_student(3, last_name="Line\nBreak")
+
+        response, body = self.download("export-students-csv")
+
+        self.assertEqual(response.status_code, 200)
+        # COPY ends lines with \n (csv.writer: \r\n), so compare the parsed rows
+        self.assertEqual(list(csv.reader(io.StringIO(body.decode()))), self.expected_rows())
+        if views.can_copy_students_csv():
+            self.assertNotIn(b"\r\n", body)
+
+
+class JsonExportTests(StudentsTestCase):
+    def load(self, body):
+        data = json.loads(body)
+        # The streamed file has the same layout as json.dumps(..., indent=2) of the whole document
+        self.assertEqual(body.decode(), json.dumps(data, indent=2))
+        return data
+
+    def test_no_students(self):
+        response, body = self.download("export-students-json")
+
+        data = self.load(body)
+        self.assertEqual(data["record_count"], 0)
+        self.assertEqual(data["students"], [])
+
+    def test_one_student(self):
+        student = self.add_student(1)
+
+        response, body = self.download("export-students-json")
+
+        data = self.load(body)
+        self.assertEqual(data["record_count"], 1)
+        self.assertEqual(data["students"], [{
+            "student_id": student.pk,
+            "first_name": "First1",
+            "last_name": "Last001",
+            "email": "student1@example.com",
+            "section__code": "INFO-390",
+        }])
+
+    def test_more_students_than_one_batch(self):
+        for n in range(5):
+            self.add_student(n)
+
+        with mock.patch.object(views, "EXPORT_BATCH_SIZE", 2):
+            response, body = self.download("export-students-json")
+
+        data = self.load(body)
+        self.assertEqual(data["record_count"], 5)
+        self.assertEqual([s["last_name"] for s in data["students"]], [f"Last{n:03d}" for n in range(5)])
+
+
+class SectionCodeSyncTests(StudentsTestCase):
+    def test_section_code_follows_section_code_change(self):
+        student = self.add_student(1)
+
+        self.section.code = "ZZZ-1"
+        self.section.save()
+
+        student.refresh_from_db()
+        self.assertEqual(student.section_code, "ZZZ-1")
+
+
+class StudentSaveTests(StudentsTestCase):
+    def test_update_fields_with_section_also_saves_section_code(self):
+        student = self.add_student(1)
+        other = Section.objects.create(code="ZZZ-1", name="Other")
+
+        student.section = other
+        student.save(update_fields=["section"])
+
+        student.refresh_from_db()
+        self.assertEqual(student.section_code, "ZZZ-1")
+
+    def test_update_fields_also_saves_updated_at(self):
+        student = self.add_student(1)
+        before = student.updated_at
+
+        student.nickname = "Changed"
+        student.save(update_fields=["nickname"])
+
+        student.refresh_from_db()
+        self.assertGreater(student.updated_at, before)
+
+
+class NotModifiedTests(StudentsTestCase):
+    """A second request with If-None-Match: <ETag of the first> gets 304 and no body."""
+
+    def setUp(self):
+        super().setUp()
+        student = self.add_student(1)
+        Enrollment.objects.create(student=student, section=self.section)
+
+    def assert_not_modified_on_repeat(self, url_name):
+        first, _ = self.download(url_name)
+        self.assertEqual(first.status_code, 200)
+        self.assertTrue(first.has_header("ETag"))
+
+        second, body = self.download(url_name, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(body, b"")
+
+    def test_section_chart(self):
+        self.assert_not_modified_on_repeat("chart-sections")
+
+    def test_enrollments_chart_png(self):
+        self.assert_not_modified_on_repeat("enrollments-chart-png")
+
+    def test_enrollments_chart_svg(self):
+        self.assert_not_modified_on_repeat("enrollments-chart-svg")
+
+    def test_csv_export(self):
+        self.assert_not_modified_on_repeat("export-students-csv")
+
+    def test_json_export(self):
+        self.assert_not_modified_on_repeat("export-students-json")
+
+    def test_enrollments_charts_are_publicly_cacheable(self):
+        for url_name in ("enrollments-chart-png", "enrollments-chart-svg"):
+            response, _ = self.download(url_name)
+            self.assertEqual(response["Cache-Control"], f"public, max-age={settings.DEFAULT_CACHE_TIMEOUT}")
+
+    def test_json_export_etag_is_weak(self):
+        # its body contains the download time ("generated_at"), so it is not byte-stable
+        response, _ = self.download("export-students-json")
+        self.assertTrue(response["ETag"].startswith('W/"'))
+
+    def test_export_etag_changes_after_an_edit(self):
+        first, _ = self.download("export-students-csv")
+
+        student = Student.objects.get()
+        student.nickname = "Changed"
+        student.save()
 
-# Create your tests here.
+        second, _ = self.download("export-students-csv", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(second.status_code, 200)
@@ -35,11 +35,12 @@ urlpatterns = [
     path("api/sections/enrollments/", views.api_enrollments_per_section, name="api-enrollments-per-section"),
 
     # Class based views: JSON endpoints
-    path("api/class-students/", StudentsAPI.as_view(), name="api-students"),
+    path("api/class-students/", StudentsAPI.as_view(), name="api-students-class"),
 
     # Charting from the self-projected JSON/API data
     path("charts/enrollments/", EnrollmentsChartPage.as_view(), name="enrollments-chart-page"),
     path("charts/enrollments.png", enrollments_chart_png, name="enrollments-chart-png"),
+    path("charts/enrollments.svg", views.enrollments_chart_svg, name="enrollments-chart-svg"),
 
     path("api/weather/", WeatherNow.as_view(), name="api-weather"),
 
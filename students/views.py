@@ -7,19 +7,28 @@ from students.models import Student, Section, Enrollment
 from django.shortcuts import get_object_or_404, render
 from django.views import View
 from django.views.generic import ListView
-from django.db.models import Count, Q
+from django.db.models import Count, F, Prefetch, Q
+from django.core.cache import cache
+from .services.enrollments import enrollment_count, get_enrollments_per_section
+from .signals import ENROLLMENT_COUNT_CACHE_KEY, STUDENT_COUNT_CACHE_KEY, STUDENT_LIST_STATS_CACHE_KEY
 
 class StudentListView(ListView):
     model = Student
     template_name = "students/student_list.html"
-    context_object_name = "student_rows_for_looping"   # full list (handled automatically)
+    context_object_name = "student_rows_for_looping"   # one page of the list (handled automatically)
+    paginate_by = 50    # ?page=2 shows students 51-100; the template gets page_obj for the links
+
+    def get_queryset(self):
+        # The template only prints each student (__str__: last name, first name, nickname)
+        # and links to it (get_absolute_url: the pk), so only SELECT those columns.
+        return Student.objects.only("student_id", "first_name", "last_name", "nickname")
 
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
         q = self.request.GET.get("q")
 
         if q:
-            search_qs = Student.objects.filter(first_name__icontains=q)
+            search_qs = self.get_queryset().filter(first_name__icontains=q)
         else:
             search_qs = None
         ctx["q"] = q
@@ -31,47 +40,62 @@ class StudentListView(ListView):
         # A) Overall totals
         #    - Count of all students
         #    - Count of all enrollments
-        ctx["total_students"] = Student.objects.count()
-        ctx["total_enrollments"] = Enrollment.objects.count()
-
-        # B) Students per Section
-        #    Section <--(reverse to Student via related_name='section_related_name')
-        #    We get: code, name, and how many students are linked to that section.
-        ctx["students_per_section"] = (
-            Section.objects
-            .values("code", "name")
-            .annotate(n_students=Count("section_related_name"))
-            .order_by("code")
-        )
-
-        # C) Enrollments per Section (plus "active" enrollments)
-        #    Section <--(reverse to Enrollment via related_name='enrollments_related_name')
-        #    We count all enrollments, and also only the ones where is_active=True.
-        ctx["enrollments_per_section"] = (
-            Section.objects
-            .values("code")
-            .annotate(
-                n_enrolls=Count("enrollments_related_name"),
-                n_active=Count("enrollments_related_name",
-
-                               # Here:
-                               # 	•	Q(enrollments_related_name__is_active=True) means “only count enrollments where is_active is true.”
-                               # 	•	Without Q, you’d count all enrollments, not just the active ones.
-                               filter=Q(enrollments_related_name__is_active=True)),
+        #    COUNT(*) reads the whole table on PostgreSQL, and these totals are the same
+        #    for every request, so each is cached for 30 seconds.
+        #    students/signals.py deletes the cached value when a row is added or removed.
+        ctx["total_students"] = cache.get_or_set(STUDENT_COUNT_CACHE_KEY, Student.objects.count, timeout=30)
+        ctx["total_enrollments"] = cache.get_or_set(ENROLLMENT_COUNT_CACHE_KEY, Enrollment.objects.count, timeout=30)
+
+        # These section stats change rarely but were recomputed on every page load
+        # and every search, so we cache them for 60 seconds.
+        # get_or_set() returns the cached dict, or calls section_stats() and caches its result.
+        # students/signals.py deletes the key whenever a Student, Section or Enrollment changes.
+        def section_stats():
+            stats = {}
+
+            # B) One pass over Section for every per-section number we need.
+            #    Section <--(reverse to Student via related_name='section_related_name')
+            #    The enrollment numbers come from subqueries (see services/enrollments.py),
+            #    so the Student join is the only join and n_students is not multiplied.
+            section_rows = list(
+                Section.objects
+                .values("code", "name", "term")
+                .annotate(
+                    n_students=Count("section_related_name"),
+                    n_enrolls=enrollment_count(),
+                    # Only count enrollments where is_active is true.
+                    n_active=enrollment_count(is_active=True),
+                )
+                .order_by("code")
             )
-            .order_by("code")
-        )
-
-        # D) Students per Term
-        #    'term' lives on Section; each Student belongs to a Section.
-        #    Count how many students are in sections for each term.
-        ctx["students_per_term"] = (
-            Section.objects
-            .values("term")
-            .annotate(n_students=Count("section_related_name"))
-            .order_by("term")
-        )
 
+            # C) Students per Section
+            #    We get: code, name, and how many students are linked to that section.
+            stats["students_per_section"] = [
+                {"code": r["code"], "name": r["name"], "n_students": r["n_students"]}
+                for r in section_rows
+            ]
+
+            # D) Enrollments per Section (plus "active" enrollments)
+            #    We count all enrollments, and also only the ones where is_active=True.
+            stats["enrollments_per_section"] = [
+                {"code": r["code"], "n_enrolls": r["n_enrolls"], "n_active": r["n_active"]}
+                for r in section_rows
+            ]
+
+            # E) Students per Term
+            #    'term' lives on Section; each Student belongs to a Section.
+            #    Add up the per-section student counts for each term.
+            students_per_term = {}
+            for r in section_rows:
+                students_per_term[r["term"]] = students_per_term.get(r["term"], 0) + r["n_students"]
+            stats["students_per_term"] = [
+                {"term": term, "n_students": n}
+                for term, n in sorted(students_per_term.items())
+            ]
+            return stats
+
+        ctx.update(cache.get_or_set(STUDENT_LIST_STATS_CACHE_KEY, section_stats, timeout=60))
 
         return ctx
 
@@ -100,9 +124,8 @@ class SectionListView(ListView):
         ctx["enrollments_per_section"] = (
             Section.objects
             .annotate(
-                n_enrolls=Count("enrollments_related_name"),
-                n_active=Count("enrollments_related_name",
-                               filter=Q(enrollments_related_name__is_active=True)),
+                n_enrolls=enrollment_count(),
+                n_active=enrollment_count(is_active=True),
             )
             .values("code", "n_enrolls", "n_active")
             .order_by("code")
@@ -114,12 +137,26 @@ class EnrollmentListView(ListView):
     model = Enrollment
     context_object_name = "enrollment_rows_for_looping"
 
+    def get_queryset(self):
+        # The template prints Enrollment.__str__, which only uses the two foreign key ids.
+        return Enrollment.objects.only("enroll_id", "student", "section")
+
 # views.py
 class StudentDetail(View):
 
     def get(self, request, primary_key):
-        student = get_object_or_404(Student, pk=primary_key)
-        enrollments = student.enrollments_related_name.all()
+        # The template prints e.section.* for every enrollment, so load the enrollments
+        # (with their sections joined) in one extra query instead of one query per row.
+        qs = (
+            Student.objects
+            .select_related("section")
+            .prefetch_related(
+                Prefetch("enrollments_related_name",
+                         queryset=Enrollment.objects.select_related("section"))
+            )
+        )
+        student = get_object_or_404(qs, pk=primary_key)
+        enrollments = student.enrollments_related_name.all()    # served from the prefetch cache
 
         return render(
             request,
@@ -135,8 +172,11 @@ class StudentDetail(View):
 #===============================================================================================
 # Creating charts using matplotlib
 
+import hashlib
 from io import BytesIO
 from django.http import HttpResponse, JsonResponse
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import etag
 
 ############ IMPORTANT
 # Count is not one of our models.
@@ -144,60 +184,138 @@ from django.http import HttpResponse, JsonResponse
 # to perform SQL COUNT() operations inside queries.
 from django.db.models import Count
 
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
+import threading
+
+# matplotlib is by far the heaviest import in this app, and most requests never draw a chart.
+# So it is NOT imported at the top of the file; the chart views load it on first use,
+# or preload_charts() below loads it at startup when settings.PRELOAD_CHARTS is on.
+#
+# Each chart view draws on its own Figure (+ its Agg canvas and Axes), created once per worker.
+# Building a new figure on every request is most of matplotlib's cost, so we reuse it
+# and just clear the Axes before each drawing. We never touch pyplot (plt.subplots/plt.close),
+# which keeps a global registry of open figures.
+# A worker can serve requests from several threads, and they all share these figures,
+# so only one thread may draw on a figure at a time (its lock).
+_section_chart = None       # (fig, canvas, ax) for section_counts_chart, once created
+_section_chart_lock = threading.Lock()
+_enrollments_chart = None   # (fig, canvas, ax) for enrollments_chart_png, once created
+_enrollments_chart_lock = threading.Lock()
+
+
+def _new_chart(figsize):
+    """Import matplotlib (first call only) and create a (fig, canvas, ax) to draw on."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize, dpi=150)
+    return fig, FigureCanvasAgg(fig), fig.add_subplot(111)
+
+
+def _get_section_chart():
+    """Create the shared section chart figure on first use. Call with _section_chart_lock held."""
+    global _section_chart
+    if _section_chart is None:
+        _section_chart = _new_chart(figsize=(6, 3))
+    return _section_chart
+
+
+def _get_enrollments_chart():
+    """Create the shared enrollments chart figure on first use. Call with _enrollments_chart_lock held."""
+    global _enrollments_chart
+    if _enrollments_chart is None:
+        _enrollments_chart = _new_chart(figsize=(6.5, 3.2))
+    return _enrollments_chart
+
+
+def preload_charts():
+    """
+    Import matplotlib and create both chart figures now, instead of in the first chart request.
+    Called from StudentsConfig.ready() when settings.PRELOAD_CHARTS is True.
+    """
+    with _section_chart_lock:
+        _get_section_chart()
+    with _enrollments_chart_lock:
+        _get_enrollments_chart()
 
 # ---------- CHART VIEW ----------
-def section_counts_chart(request):
+def section_chart_etag(request):
+    """
+    ETag (a fingerprint) for the section chart: a hash of the (code, student count) rows.
+    Runs before the view (see @etag below). The rows are kept on the request so the
+    view can reuse them instead of running the same query again.
+    """
     # Count how many students belong to each section
     # (Student.section has related_name='section_related_name')
-    data = (
+    request.section_chart_rows = list(
         Section.objects
-        .annotate(student_count=Count("section_related_name"))
+        .annotate(n=Count("section_related_name"))
+        .values_list("code", "n")
         .order_by("code")
     )
+    return hashlib.md5(json.dumps(request.section_chart_rows).encode()).hexdigest()
+
+
+# cache_control(max_age=300) lets the browser (or a CDN) reuse the image for 5 minutes.
+# etag(...) sends the fingerprint with the image. When the browser asks again with
+# If-None-Match: <same fingerprint>, Django answers "304 Not Modified" with no body,
+# and the view below (and matplotlib) never runs.
+@cache_control(max_age=300)
+@etag(section_chart_etag)
+def section_counts_chart(request):
+    rows = request.section_chart_rows
+
+    # Drawing the PNG is the slow part, and the numbers rarely change.
+    # So the finished PNG bytes are cached under a key made from the data itself:
+    # same counts → same key → reuse the image; any change → new key → draw again.
+    key = "chart:sections:" + hashlib.md5(json.dumps(rows).encode()).hexdigest()
+    png = cache.get(key)
+    if png is not None:
+        return HttpResponse(png, content_type="image/png")
 
-    labels = [sec.code for sec in data]
-    counts = [sec.student_count for sec in data]
+    # One pass: zip(*rows) turns [(code, n), ...] into a labels column and a counts column.
+    # (With no sections there is nothing to unpack, hence the "else".)
+    labels, counts = zip(*rows) if rows else ((), ())
 
-    # fig: the whiteboard, and
-    # ax:  the rectangle you actually draw on.
-    fig, ax = plt.subplots(figsize=(6, 3), dpi=150)
+    with _section_chart_lock:
+        # fig: the whiteboard, and
+        # ax:  the rectangle you actually draw on.
+        # (Both are the shared module-level ones; clear() wipes the previous drawing.)
+        fig, canvas, ax = _get_section_chart()
+        ax.clear()
 
-    # .bar:
-    #   •	This is Matplotlib’s method for creating a bar chart.
-    # 	•	It draws rectangular bars based on x values (labels) and heights (counts).
-    ax.bar(labels, counts, color="#13294B")  # Illinois Blue
+        # .bar:
+        #   •	This is Matplotlib’s method for creating a bar chart.
+        # 	•	It draws rectangular bars based on x values (labels) and heights (counts).
+        ax.bar(labels, counts, color="#13294B")  # Illinois Blue
 
-    ax.set_title("Students per Section", fontsize=10, color="#13294B")
+        ax.set_title("Students per Section", fontsize=10, color="#13294B")
 
-    ax.set_xlabel("Section", fontsize=8)
-    ax.set_ylabel("Students", fontsize=8)
+        ax.set_xlabel("Section", fontsize=8)
+        ax.set_ylabel("Students", fontsize=8)
 
-    ax.tick_params(axis="x", rotation=45, labelsize=8)
-    ax.tick_params(axis="y", labelsize=8)
+        ax.tick_params(axis="x", rotation=45, labelsize=8)
+        ax.tick_params(axis="y", labelsize=8)
 
-    # tight_layout() automatically adjusts the spacing between chart elements like:
-    # 	•	the axes labels (x/y),
-    # 	•	the title,
-    # 	•	and the plot area (bars, ticks, etc.)
-    # so that nothing gets cut off when you save or display the figure.
+        # tight_layout() automatically adjusts the spacing between chart elements like:
+        # 	•	the axes labels (x/y),
+        # 	•	the title,
+        # 	•	and the plot area (bars, ticks, etc.)
+        # so that nothing gets cut off when you save or display the figure.
 
-    # Without tight_layout(), Matplotlib often leaves awkward margins
-    # or chops text off the edges when saving to an image file.
-    fig.tight_layout()
+        # Without tight_layout(), Matplotlib often leaves awkward margins
+        # or chops text off the edges when saving to an image file.
+        fig.tight_layout()
 
-    # BytesIO()
-    # 	•	It lets you create a temporary file-like object, but stored in memory, not on disk.
-    # 	•	Think of it as a fake file drawer that lives in RAM.
-    buf = BytesIO()
-    fig.savefig(buf, format="png")
+        # BytesIO()
+        # 	•	It lets you create a temporary file-like object, but stored in memory, not on disk.
+        # 	•	Think of it as a fake file drawer that lives in RAM.
+        buf = BytesIO()
+        canvas.print_png(buf)
+        png = buf.getvalue()
 
-    plt.close(fig)
-    buf.seek(0)
+    cache.set(key, png, 300)
 
-    return HttpResponse(buf.getvalue(), content_type="image/png")
+    return HttpResponse(png, content_type="image/png")
 
 #=======================================================
 from .forms import FeedbackForm
@@ -266,9 +384,22 @@ class StudentCreateView(CreateView):
 
 #===================================================================================================
 # New addition/changes: api_students(); api_ping(); api_json()
+from django.core.paginator import Paginator
 from django.http import JsonResponse
 from django.db.models import Count, Q
 
+# orjson is a JSON library written in Rust; it serializes several times faster than
+# the standard json module that JsonResponse uses. It returns bytes, which HttpResponse
+# can send as-is. Used by the JSON API views below.
+import orjson
+
+
+class OrjsonResponse(HttpResponse):
+    """Like JsonResponse, but serializes `data` with orjson."""
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(orjson.dumps(data), **kwargs)
+
 # --- Tiny health check (handy when wiring tools) ---
 # Difference between returning a JsonResponse vs HttpResponse
 def api_ping_jsonresponse_1(request):
@@ -304,46 +435,56 @@ def api_ping_httpresponse_1(request):
 
 #===================================================================================================
 # Main api:
-def api_students(request):
+# The function view (api_students) and the class view (StudentsAPI) return the same data,
+# so both call this one implementation.
+def _api_students_impl(request):
     """
-    GET /api/students/?q=alice
+    GET /api/function-students/?q=alice&page=1&page_size=50
     Optional ?q= filters by first_name OR last_name OR nickname.
+    Optional ?page= / ?page_size= (max 200) pick which page of results to return.
     """
     # First storing the user request in q
     q = (request.GET.get("q") or "").strip()
 
-    # Now, separately loading the Student table data in qs
-    qs = Student.objects.all().values("student_id", "first_name", "last_name", "nickname", "email", "section__code")
+    # Now, build ONE queryset. Nothing is sent to the database yet (querysets are lazy).
+    qs = Student.objects.all()
 
-    # If q is not empty, then filter the data in qs and only show what's requested in 'q' by the user.
+    # If q is not empty, then narrow the same queryset down to what's requested in 'q' by the user.
     if q:
-        qs = Student.objects.filter(
+        qs = qs.filter(
             Q(first_name__icontains=q) |
             Q(last_name__icontains=q) |
             Q(nickname__icontains=q)
-        ).values("student_id", "first_name", "last_name", "nickname", "email", "section__code")
+        )
 
-    data = list(qs.order_by("last_name", "first_name"))
-    return JsonResponse({"count": len(data), "results": data})
+    # values() already limits the SELECT to these columns, so no .only() is needed.
+    # The section code comes from Student.section_code (a stored copy of section.code),
+    # so there is no JOIN to Section. It is still returned under the "section__code" key.
+    qs = (
+        qs.order_by("last_name", "first_name")
+        .values("student_id", "first_name", "last_name", "nickname", "email",
+                section__code=F("section_code"))
+    )
 
-# --- Simple list of students (minimal fields) ---
-def api_students(request):
-    """
-    GET /api/students/?q=alice
-    Optional ?q= filters by first_name OR last_name OR nickname.
-    """
-    q = (request.GET.get("q") or "").strip()
-    qs = Student.objects.all().values("student_id", "first_name", "last_name", "nickname", "email", "section__code")
+    # Return one page at a time: ?page=2&page_size=50 (page_size is capped at 200).
+    # Paginator runs a COUNT(*) for "count" and fetches only the rows of the requested page.
+    try:
+        page_size = min(int(request.GET.get("page_size", 50)), 200)
+    except ValueError:
+        page_size = 50
+    paginator = Paginator(qs, max(page_size, 1))
+    page = paginator.get_page(request.GET.get("page"))  # bad or out-of-range page → nearest page
 
-    if q:
-        qs = Student.objects.filter(
-            Q(first_name__icontains=q) |
-            Q(last_name__icontains=q) |
-            Q(nickname__icontains=q)
-        ).values("student_id", "first_name", "last_name", "nickname", "email", "section__code")
+    return OrjsonResponse({
+        "count": paginator.count,
+        "page": page.number,
+        "num_pages": paginator.num_pages,
+        "results": list(page.object_list),
+    })
 
-    data = list(qs.order_by("last_name", "first_name"))
-    return JsonResponse({"count": len(data), "results": data})
+
+def api_students(request):
+    return _api_students_impl(request)
 
 
 # --- Students per section (good for bar charts) ---
@@ -352,16 +493,16 @@ def api_students_per_section(request):
     GET /api/sections/students/
     Returns labels + counts arrays for quick charting.
     """
-    rows = (
+    rows = list(
         Section.objects
         .annotate(n_students=Count("section_related_name"))
-        .values("code", "n_students")
+        .values_list("code", "n_students")
         .order_by("code")
     )
 
-    labels = [r["code"] for r in rows]
-    counts = [r["n_students"] for r in rows]
-    return JsonResponse({"labels": labels, "counts": counts})
+    # One pass: zip(*rows) splits the (code, count) pairs into two columns (JSON arrays).
+    labels, counts = zip(*rows) if rows else ((), ())
+    return OrjsonResponse({"labels": labels, "counts": counts})
 
 
 # --- Enrollments per section (all vs active) ---
@@ -369,16 +510,7 @@ def api_enrollments_per_section(request):
     """
     GET /api/sections/enrollments/
     """
-    rows = (
-        Section.objects
-        .annotate(
-            n_all=Count("enrollments_related_name"),
-            n_active=Count("enrollments_related_name", filter=Q(enrollments_related_name__is_active=True)),
-        )
-        .values("code", "n_all", "n_active")
-        .order_by("code")
-    )
-    return JsonResponse({"results": list(rows)})
+    return OrjsonResponse({"results": get_enrollments_per_section()})
 
 
 #===================================================================================================
@@ -388,28 +520,14 @@ def api_enrollments_per_section(request):
 class StudentsAPI(View):
 
     def get(self, request):
-        q = (request.GET.get("q") or "").strip()
-        qs = Student.objects.all()
-        if q:
-            qs = qs.filter(
-                Q(first_name__icontains=q) |
-                Q(last_name__icontains=q) |
-                Q(nickname__icontains=q)
-            )
-        data = list(qs.values("student_id","first_name",
-                              "last_name","nickname",
-                              "email","section__code")
-
-                      .order_by("last_name","first_name"))
-
-        return JsonResponse({"count": len(data), "results": data})
+        return _api_students_impl(request)
 
 #===================================================================================================
 # New addition/changes: Charting via own project's API projected data
 
 import json
-import urllib.request
-from django.urls import reverse
+from django.conf import settings
+from django.utils.html import escape
 from django.views.generic import TemplateView
 
 # Optional: You can display the image from enrollments_chart_png() directly on a link.
@@ -417,99 +535,150 @@ from django.views.generic import TemplateView
 class EnrollmentsChartPage(TemplateView):
     template_name = "students/enrollments_chart.html"
 
+
+def enrollments_chart_etag(request):
+    """
+    ETag (a fingerprint) for the enrollments chart: a hash of the per-section
+    (code, all enrollments, active enrollments) numbers the chart is drawn from.
+    It is one small query, so it is cheap to run on every request.
+    The rows are kept on the request so the chart views can reuse them.
+    """
+    # The rows come from get_enrollments_per_section() (students/services/enrollments.py),
+    # the same function behind our JSON API /api/sections/enrollments/:
+    #   [
+    #     {"code": "INFO-390-MG", "n_all": 2, "n_active": 2},
+    #     {"code": "INFO-490-MG", "n_all": 1, "n_active": 1}
+    #   ]
+    # Earlier versions downloaded these rows from our own JSON API with urllib
+    # (build_absolute_uri + urlopen + json.load). That is a full HTTP round trip
+    # from the server to itself; calling the same function the API uses skips it.
+    request.enrollments_chart_rows = get_enrollments_per_section()
+    return hashlib.md5(json.dumps(request.enrollments_chart_rows).encode()).hexdigest()
+
+
+# etag(...): if the browser already has this exact chart (If-None-Match matches),
+#            answer "304 Not Modified" right away: no matplotlib, no body.
+# cache_control(public=True, ...): browsers and shared caches (a CDN) may keep the image
+#            for DEFAULT_CACHE_TIMEOUT seconds; after that they ask again with the ETag.
+@cache_control(public=True, max_age=settings.DEFAULT_CACHE_TIMEOUT)
+@etag(enrollments_chart_etag)
 def enrollments_chart_png(request):
     """
-    Server-side fetch of our own JSON API (no JS in the browser),
-    then build a matplotlib PNG and return it.
-    Expected API shape (from our earlier example):
-      {
-        "rows": [
-          {"code": "INFO-390-MG", "n_enrolls": 2, "n_active": 2},
-          {"code": "INFO-490-MG", "n_enrolls": 1, "n_active": 1}
-        ]
-      }
+    Build a matplotlib PNG of all vs. active enrollments per section (no JS in the browser).
     """
-    # --- 1) DATA: fetch rows from your own JSON API -----------------------------
-    # Build absolute URL to your API (works in dev too)
-    # The below code is just work likes this:
-
-    # We do not write our local machine's url as it is static and not dynamic
-    # And we do not want to bother ourselves for changing the url again-and-again
-    # api_url = request.build_absolute_uri(reverse("http://127.0.0.1:8000/api/sections/enrollments/"))
-    # api_url = request.build_absolute_uri(reverse("http://www.illinois.edu/api/sections/enrollments/"))
-
-    api_url = request.build_absolute_uri(reverse("api-enrollments-per-section"))
-    # Output:
-    # api_url = http://127.0.0.1:8000/api/sections/enrollments/
-    # or
-    # api_url = http://www.illinois.edu/api/sections/enrollments/
-
-    # 	•	reverse():
-    #    	•	It is equivalent to using {% url 'api-enrollments-per-section' %} in a template.
-
-    # 	•	request.build_absolute_uri():
-    #    	•	This method takes a relative path (like /api/sections/enrollments/)
-    #        	and builds a full absolute URL including the current domain.
-
-    # Pull JSON from the API
-    with urllib.request.urlopen(api_url) as resp:
-        payload = json.load(resp)
-
-    # --- 2) PREPARING DATA: save columns into separate lists ------------------
-
-    # 	•	payload is the Python dictionary you got from json.load(resp).
-    # 	•	.get("rows", []) safely extracts the value associated with "rows".
-    # If "rows" is missing for any reason (bad response, empty API, etc.), it defaults to an empty list ([]).
-
-    # Right now, our data looks like a dictionary having "rows" as a single "key"
-    # and all the columns as dictionaries in a list. For eg: { "a": [ {}, {}, {} ] }
-    #
-    ##   {
-    ##   "results": [
-    ##     {"code": "INFO-390-MG", "n_enrolls": 2, "n_active": 2},
-    ##     {"code": "INFO-490-MG", "n_enrolls": 1, "n_active": 1}
-    ##   ]
-    ##   }
-
-    # We want to extract it such that we are just left with the nested list
-    ##   "results": [
-    ##              {"code": "INFO-390-MG", "n_enrolls": 2, "n_active": 2},
-    ##              {"code": "INFO-490-MG", "n_enrolls": 1, "n_active": 1}
-    ##           ]
-
-    # IMPORTANT:
-    # If you ever get a blank visualization but everything works, it might be because of no data being given to your charts
-    # It might be because the name of your table might be different.
-    # For me, here it is "results"
-    rows = payload.get("results", [])
-
-    # This is a list comprehension, a compact way to loop through all rows and extract each section’s code.
-    # labels = ["INFO-390-MG", "INFO-490-MG"]
-    labels       = [r["code"] for r in rows]
-    all_counts   = [r["n_all"] for r in rows]
-    active_counts= [r["n_active"]  for r in rows]
+    # --- 1) DATA: the rows enrollments_chart_etag() already read for the ETag -----
+    rows = request.enrollments_chart_rows
+
+    # The PNG only changes when these numbers change, so it is cached under a key made
+    # from the numbers themselves (like section_counts_chart): matplotlib runs once per
+    # change of the data, and every other request is a cache lookup.
+    # An old key can never hold a wrong image, so it is kept for an hour.
+    key = "chart:enroll:" + hashlib.md5(json.dumps(rows).encode()).hexdigest()
+    png = cache.get(key)
+    if png is not None:
+        return HttpResponse(png, content_type="image/png")
+
+    # --- 2) PREPARING DATA: split the rows into separate columns ---------------
+    # One pass over the rows (instead of one list comprehension per column):
+    # each row becomes a (code, n_all, n_active) tuple, and zip(*...) regroups those
+    # tuples column by column:
+    #   labels        = ("INFO-390-MG", "INFO-490-MG")
+    #   all_counts    = (2, 1)
+    #   active_counts = (2, 1)
+    # (With no sections there is nothing to unpack, hence the "else".)
+    labels, all_counts, active_counts = (
+        zip(*[(r["code"], r["n_all"], r["n_active"]) for r in rows]) if rows else ((), (), ())
+    )
 
     # --- 3) PRESENTATION: turn rows into a PNG with matplotlib ------------------
     # Plot: grouped bars (All vs Active)
     x = range(len(labels))
     width = 0.4
 
-    fig, ax = plt.subplots(figsize=(6.5, 3.2), dpi=150)
-    ax.bar([i - width/2 for i in x], all_counts,   width=width, label="All",    color="#13294B")
-    ax.bar([i + width/2 for i in x], active_counts, width=width, label="Active", color="#E84A27")
-
-    ax.set_title("Enrollments per Section")
-    ax.set_ylabel("Enrollments")
-    ax.set_xticks(list(x))
-    ax.set_xticklabels(labels, rotation=45, ha="right")
-    ax.legend()
-    fig.tight_layout()
-
-    buf = BytesIO()
-    fig.savefig(buf, format="png")
-    plt.close(fig)
-    buf.seek(0)
-    return HttpResponse(buf.getvalue(), content_type="image/png")
+    with _enrollments_chart_lock:
+        # Shared module-level figure; cla() wipes the previous drawing.
+        fig, canvas, ax = _get_enrollments_chart()
+        ax.cla()
+        ax.bar([i - width/2 for i in x], all_counts,   width=width, label="All",    color="#13294B")
+        ax.bar([i + width/2 for i in x], active_counts, width=width, label="Active", color="#E84A27")
+
+        ax.set_title("Enrollments per Section")
+        ax.set_ylabel("Enrollments")
+        ax.set_xticks(list(x))
+        ax.set_xticklabels(labels, rotation=45, ha="right")
+        ax.legend()
+        fig.tight_layout()
+
+        buf = BytesIO()
+        canvas.print_png(buf)
+        png = buf.getvalue()
+
+    cache.set(key, png, 60 * 60)
+
+    return HttpResponse(png, content_type="image/png")
+
+
+# Same chart as enrollments_chart_png(), but drawn as an SVG with plain f-strings.
+# An SVG is just text (<rect> for each bar, <text> for each label), so no matplotlib
+# is needed: no heavy import, no figure, no PNG encoding. The browser does the drawing.
+# The chart page (enrollments_chart.html) uses this one; the PNG URL still works.
+# Same browser/CDN caching and ETag as the PNG.
+@cache_control(public=True, max_age=settings.DEFAULT_CACHE_TIMEOUT)
+@etag(enrollments_chart_etag)
+def enrollments_chart_svg(request):
+    rows = request.enrollments_chart_rows
+
+    # Canvas size and margins (in pixels) around the plot area
+    width, height = 650, 320
+    left, right, top, bottom = 50, 15, 35, 80
+    plot_w = width - left - right
+    plot_h = height - top - bottom
+
+    # y axis: about 5 whole-number ticks from 0 up to the largest count
+    # (active enrollments are a subset of all enrollments, so n_all is always the taller bar)
+    y_max = max((r["n_all"] for r in rows), default=0) or 1
+    step = -(-y_max // 5)               # ceil(y_max / 5)
+    y_top = step * -(-y_max // step)    # y_max rounded up to a multiple of step
+
+    def y(value):
+        return top + plot_h - plot_h * value / y_top
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" font-family="sans-serif" font-size="11">',
+        f'<rect width="{width}" height="{height}" fill="white"/>',
+        f'<text x="{left + plot_w / 2}" y="20" text-anchor="middle" font-size="14">Enrollments per Section</text>',
+        f'<text transform="translate(14 {top + plot_h / 2}) rotate(-90)" text-anchor="middle">Enrollments</text>',
+    ]
+
+    # Horizontal grid lines + y tick labels
+    for value in range(0, y_top + 1, step):
+        parts.append(f'<line x1="{left}" x2="{left + plot_w}" y1="{y(value):.1f}" y2="{y(value):.1f}" stroke="#ddd"/>')
+        parts.append(f'<text x="{left - 5}" y="{y(value) + 4:.1f}" text-anchor="end">{value}</text>')
+
+    # Grouped bars: "All" on the left, "Active" on the right of each section's slot
+    slot = plot_w / max(len(rows), 1)
+    bar_w = slot * 0.4
+    for i, r in enumerate(rows):
+        center = left + slot * (i + 0.5)
+        for value, color, x in ((r["n_all"], "#13294B", center - bar_w),
+                                (r["n_active"], "#E84A27", center)):
+            parts.append(f'<rect x="{x:.1f}" y="{y(value):.1f}" width="{bar_w:.1f}" '
+                         f'height="{top + plot_h - y(value):.1f}" fill="{color}"/>')
+        # Section code under the bars, tilted 45° like the matplotlib version
+        label_y = top + plot_h + 14
+        parts.append(f'<text transform="translate({center:.1f} {label_y}) rotate(-45)" '
+                     f'text-anchor="end">{escape(r["code"])}</text>')
+
+    # Axis line and legend
+    parts.append(f'<line x1="{left}" x2="{left + plot_w}" y1="{top + plot_h}" y2="{top + plot_h}" stroke="#333"/>')
+    for n, (name, color) in enumerate((("All", "#13294B"), ("Active", "#E84A27"))):
+        lx = left + plot_w - 120 + n * 60
+        parts.append(f'<rect x="{lx}" y="{top - 10}" width="10" height="10" fill="{color}"/>')
+        parts.append(f'<text x="{lx + 14}" y="{top - 1}">{name}</text>')
+    parts.append('</svg>')
+
+    return HttpResponse("\n".join(parts), content_type="image/svg+xml")
 
 
 
@@ -522,12 +691,39 @@ def enrollments_chart_png(request):
 
 # requests lets your Python code talk to other websites or APIs.
 import requests
+from asgiref.sync import sync_to_async
+from requests.adapters import HTTPAdapter
+
+# One shared Session for the whole worker instead of requests.get() every time.
+# A Session keeps connections open (keep-alive) and reuses them, so repeat calls
+# skip the new TCP connection + TLS handshake to the same host.
+# HTTPAdapter: keep pools for up to 4 hosts, up to 32 open connections each.
+_http_session = requests.Session()
+_http_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+
+# Cache key for Champaign's current weather (the coordinates below are fixed;
+# if they ever come from the request, put them in the key).
+WEATHER_CACHE_KEY = "weather:champaign_cw"
+
 
 class WeatherNow(View):
     """
     Call Open-Meteo (keyless) and return just the bits we need.
+
+    This is an async view ("async def get"). When the site runs under ASGI
+    (illinois/asgi.py, e.g. with uvicorn or daphne), a worker does not sit idle
+    while Open-Meteo answers: it serves other requests and comes back at each "await".
+    Under WSGI (runserver, illinois/wsgi.py) Django simply runs it to completion.
     """
-    def get(self, request):
+    async def get(self, request):
+
+        # Step 0: Use the cached weather if we fetched it in the last 5 minutes.
+        # Open-Meteo only updates current_weather every 15 minutes ("interval": 900),
+        # so every visitor can share one upstream call instead of making their own.
+        # cache.aget()/aset() are the async versions of cache.get()/set().
+        cached_weather = await cache.aget(WEATHER_CACHE_KEY)
+        if cached_weather is not None:
+            return JsonResponse({"ok": True, "weather": cached_weather})
 
         # Step 1: Prepare parameters for the API request
         params = {
@@ -539,15 +735,22 @@ class WeatherNow(View):
 
         try:
             # Step 2: Make a GET request to the external API
-            # requests.get() contacts the Open-Meteo endpoint with the parameters above
+            # _http_session.get() contacts the Open-Meteo endpoint with the parameters above
+            # (same as requests.get(), but reusing an open connection when there is one)
 
             ##### Step 2.1:
             ##### Output: https://api.open-meteo.com/v1/forecast?latitude=40.11&longitude=-88.24&current_weather=true
 
             ##### Step 2.2:
             ##### timeout=5 ensures Django doesn’t hang forever if the API is slow
-            output_raw_all = requests.get("https://api.open-meteo.com/v1/forecast",
-                             params=params, timeout=5)
+
+            ##### Step 2.3:
+            ##### requests itself is not async, so sync_to_async() runs the call in a
+            ##### thread and "await" waits for it without blocking the event loop.
+            ##### thread_sensitive=False: it touches no database, so any thread will do.
+            output_raw_all = await sync_to_async(_http_session.get, thread_sensitive=False)(
+                "https://api.open-meteo.com/v1/forecast", params=params, timeout=5,
+            )
 
             # Step 3: Raise an error if the HTTP status code indicates a problem (e.g., 404, 500)
             output_raw_all.raise_for_status()
@@ -555,7 +758,9 @@ class WeatherNow(View):
             # Step 4: Convert the response (which is text) into a Python dictionary
             # Return the entire raw JSON as-is for exploration
             # (This can be very large so use carefully in production!)
-            output_polished_all = output_raw_all.json()
+            # orjson.loads() parses the raw bytes (.content) several times faster than
+            # output_raw_all.json(), which uses the standard json module.
+            output_polished_all = orjson.loads(output_raw_all.content)
 
             # Step 5: Extract just the values of "current_weather" key from the JSON
             # If missing, return an empty dictionary instead of crashing
@@ -580,13 +785,16 @@ class WeatherNow(View):
             ##    }
             output_polished_cw_only = output_polished_all.get("current_weather", {})
 
+            # Remember it for 5 minutes (errors below are never cached)
+            await cache.aset(WEATHER_CACHE_KEY, output_polished_cw_only, 300)
 
             # Step 6: Return success response with simplified data
             # The browser (or JS frontend) can consume this JSON directly
             return JsonResponse({"ok": True, "weather": output_polished_cw_only})
 
         # Step 7: If *any* network or parsing error occurs, handle it gracefully
-        except requests.exceptions.RequestException as e:
+        # (orjson.JSONDecodeError: the API answered, but not with valid JSON)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
 
             # Return a 502 (Bad Gateway) response with an error message
             # This helps us diagnose connectivity or API issues
@@ -605,25 +813,28 @@ class ReportsView(TemplateView):
 
         ctx = super().get_context_data(**kwargs)
 
-        ctx["students_per_section"] = (
+        # One query for both tables: the student count is a JOIN + COUNT, and the
+        # enrollment counts are subqueries (services/enrollments.py), so the two
+        # never multiply each other the way two Count() joins would.
+        # No list() here on purpose: the queryset only runs when the template loops
+        # over it, and reports.html caches the tables with {% cache %}, so while the
+        # cached HTML is fresh the page makes no database query at all.
+        section_rows = (
             Section.objects
             .values("code", "name")
-            .annotate(n_students=Count("section_related_name"))
-            .order_by("code")
-        )
-
-
-        ctx["enrolls_per_section"] = (
-            Section.objects
             .annotate(
-                n_all=Count("enrollments_related_name"),
-                n_active=Count("enrollments_related_name",
-                               filter=Q(enrollments_related_name__is_active=True)),
+                n_students=Count("section_related_name"),
+                n_all=enrollment_count(),
+                n_active=enrollment_count(is_active=True),
             )
-            .values("code", "n_all", "n_active")
             .order_by("code")
         )
 
+        # Each row has every column, so both tables loop over the same queryset
+        # (a queryset keeps its rows after the first loop, so it is still one query).
+        ctx["students_per_section"] = section_rows
+        ctx["enrolls_per_section"] = section_rows
+
         return ctx
 
 
@@ -632,81 +843,203 @@ class ReportsView(TemplateView):
 
 import csv
 from datetime import datetime
+from django.db import connection
+from django.http import StreamingHttpResponse
+from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import condition
+from .services.exports import STUDENT_EXPORT_FIELDS, get_students_export_rows, get_students_export_version
+
+
+# How many rows the exports read from the database (and send to the browser) at a time.
+EXPORT_BATCH_SIZE = 2000
 
 
+class Echo:
+    """
+    A "file" whose write() just hands the value back.
+    csv.writer(Echo()).writerow(row) then returns the formatted CSV line
+    instead of storing it, so we can yield it straight to the client.
+    (This is the pattern from the Django docs on streaming large CSV files.)
+    """
+    def write(self, value):
+        return value
+
+
+def can_copy_students_csv():
+    """
+    True when copy_students_csv() can run: PostgreSQL through the psycopg 3 driver.
+    Django also supports psycopg2, which has no cursor.copy() (its copy_expert() writes
+    into a file instead of handing us blocks to stream), so psycopg2 uses the Python export.
+    """
+    if connection.vendor != "postgresql":
+        return False
+    # Imported here: this module imports psycopg or psycopg2, which SQLite setups don't have.
+    from django.db.backends.postgresql.psycopg_any import is_psycopg3
+    return is_psycopg3
+
+
+def copy_students_csv():
+    """
+    PostgreSQL + psycopg 3 only: let the database write the CSV itself with COPY ... TO STDOUT.
+    Postgres formats every field in C, so Python never builds a tuple per row;
+    we just pass the blocks of CSV bytes it sends straight on to the browser.
+    Uses the psycopg 3 cursor.copy() API (Django's cursor passes it through).
+
+    The file has the same rows and quoting as the Python export, but its lines end
+    with "\n" where csv.writer writes "\r\n": COPY has no option for the line ending,
+    and replacing it afterwards would also change line breaks inside quoted values.
+    """
+    # section_code is the copy of section.code kept on Student, so no JOIN is needed.
+    # HEADER writes the column names as the first line, the same ones the ORM path writes.
+    sql = (
+        f"COPY (SELECT {', '.join(STUDENT_EXPORT_FIELDS)} "
+        f"FROM {Student._meta.db_table} ORDER BY last_name, first_name) "
+        f"TO STDOUT WITH (FORMAT csv, HEADER)"
+    )
+    with connection.cursor() as cursor:
+        with cursor.copy(sql) as copy:
+            for block in copy:
+                yield bytes(block)
+
+
+def students_export_version(request):
+    """
+    How many students there are and when the newest change was saved (Student.updated_at),
+    from get_students_export_version() (students/services/exports.py).
+    Kept on the request so the ETag, Last-Modified, filename and record count all reuse it.
+    """
+    if not hasattr(request, "students_export_version"):
+        request.students_export_version = get_students_export_version()
+    return request.students_export_version
+
+
+def students_export_etag(request):
+    # The count is part of the ETag because deleting a student does not change Max(updated_at).
+    version = students_export_version(request)
+    last = version["last"].isoformat() if version["last"] else ""
+    return f'{version["n"]}-{last}'
+
+
+def students_export_weak_etag(request):
+    # For the JSON export: its "generated_at" is the time of the download, so two files
+    # with the same students are not byte-for-byte equal. A weak ETag (W/"...") says
+    # exactly that: "same content", not "same bytes".
+    return f'W/"{students_export_etag(request)}"'
+
+
+def students_export_last_modified(request):
+    return students_export_version(request)["last"]
+
+
+def students_export_filename(request, extension):
+    """
+    "students_2025-10-12_17-35.csv": named after the time of the newest change (not "now"),
+    so the same data always downloads under the same name.
+    (datetime.now() if there are no students yet.)
+    strftime() formats it safely for filenames:
+      %Y = 4-digit year, %m = month, %d = day, %H = hour, %M = minute
+    """
+    last_change = students_export_version(request)["last"] or datetime.now()
+    return f"students_{last_change.strftime('%Y-%m-%d_%H-%M')}.{extension}"
+
+
+# Both exports use the same three decorators:
+# condition(...): sends ETag + Last-Modified with the file. If the browser (or a proxy)
+#            already has this version (If-None-Match / If-Modified-Since match), Django
+#            answers "304 Not Modified" and the export below never runs.
+# cache_control(no_cache=True): caches may keep the file, but must ask us (cheaply, with
+#            the headers above) before reusing it, so nobody gets an outdated export.
+# gzip_page: if the browser sends "Accept-Encoding: gzip", the file is compressed on the
+#            fly (still streamed), and "Vary: Accept-Encoding" is added. Rows of names and
+#            emails compress very well, so downloads get several times smaller.
+#            Only the exports use it: compressing pages that contain a CSRF token
+#            (site-wide GZipMiddleware) opens them to the BREACH attack.
+@gzip_page
+@cache_control(no_cache=True)
+@condition(etag_func=students_export_etag, last_modified_func=students_export_last_modified)
 def export_students_csv(request):
     """
     Generate and download a CSV file of all students.
-    Demonstrates Django’s HttpResponse + Python’s csv library.
+    Demonstrates Django’s StreamingHttpResponse + Python’s csv library.
     """
 
     # ---------------------------------------------------------------
-    # STEP 1: Create a timestamp to make the filename unique
+    # STEP 1: Pick the filename (see students_export_filename above)
     # ---------------------------------------------------------------
-    # datetime.now() gives the current date & time.
-    # strftime() formats it safely for filenames:
-    #   %Y = 4-digit year, %m = month, %d = day, %H = hour, %M = minute
-    # Example output: "2025-10-12_17-35"
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
+    filename = students_export_filename(request, "csv")
 
-    # Use that timestamp inside the downloadable filename
-    filename = f"students_{timestamp}.csv"
+    # On PostgreSQL (psycopg 3), skip STEP 2-4: the database produces the CSV
+    # (see copy_students_csv above; its lines end with \n instead of \r\n).
+    # SQLite, MySQL and psycopg2 have no streaming COPY, so they use the Python version below.
+    if can_copy_students_csv():
+        response = StreamingHttpResponse(copy_students_csv(), content_type="text/csv")
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
 
     # ---------------------------------------------------------------
-    # STEP 2: Prepare the HTTP response
+    # STEP 2: Get the data from the database
     # ---------------------------------------------------------------
-    # HttpResponse is Django’s way of sending data back to the browser. (Like I mentioned in week 8-9)
-    # The 'content_type' tells the browser what kind of file it is.
-    #   text/csv → browser knows it's a spreadsheet-friendly CSV file.
-    response = HttpResponse(content_type="text/csv")
-
-    # This header tells the browser: “Don’t just display this — download it!”
-    # The word 'attachment' triggers a file download prompt.
-    # filename="students_2025-10-12_17-35.csv" sets the default save name.
-    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    # get_students_export_rows() (students/services/exports.py) is the query both
+    # exports share: tuples of STUDENT_EXPORT_FIELDS, sorted by name, no JOIN.
+    # iterator(chunk_size=EXPORT_BATCH_SIZE) reads the rows from the database in batches
+    # instead of loading the whole table into memory first.
+    rows = get_students_export_rows().iterator(chunk_size=EXPORT_BATCH_SIZE)
 
     # ---------------------------------------------------------------
     # STEP 3: Initialize a CSV writer
     # ---------------------------------------------------------------
-    # The csv.writer() function turns the HTTP response object into a
-    # "file-like" object that you can write rows to.
-    writer = csv.writer(response)
-
-    # Write the header row first (column names)
-    writer.writerow(["student_id", "first_name", "last_name", "email", "section_code"])
+    # The writer "writes" into Echo, which simply returns each formatted line.
+    writer = csv.writer(Echo())
 
     # ---------------------------------------------------------------
-    # STEP 4: Get the data from the database
-    # ---------------------------------------------------------------
-    # values_list() extracts tuples instead of full objects → faster and lighter.
-    # select_related("section") joins Section so we can grab section__code.
-    # order_by() ensures sorted output.
-    rows = (
-        Student.objects
-        .select_related("section")
-        .values_list("student_id", "first_name", "last_name", "email", "section__code")
-        .order_by("last_name", "first_name")
-    )
-
-    # ---------------------------------------------------------------
-    # STEP 5: Write each row to the CSV file
+    # STEP 4: A generator that produces the file one line at a time
     # ---------------------------------------------------------------
     # Each 'row' is a tuple like (1, "Alice", "Johnson", "alice@example.com", "INFO-390-MG")
-    for row in rows:
-        writer.writerow(row)
+    # Lines are sent in batches of EXPORT_BATCH_SIZE: one tiny chunk per student
+    # would mean one socket write per student, which is slow for big tables.
+    #
+    # Fast path: the columns are always the same five, and almost no value contains a
+    # comma, a quote or a line break. Such a row needs no quoting, so an f-string gives
+    # exactly the line csv.writer would (about 2.5x faster). Rows that do need quoting
+    # (the comma count is off, or there is a quote / line break) go through csv.writer.
+    def csv_lines():
+        # Write the header row first (column names)
+        batch = [writer.writerow(STUDENT_EXPORT_FIELDS)]
+        for row in rows:
+            student_id, first_name, last_name, email, section_code = row
+            line = f"{student_id},{first_name},{last_name},{email},{section_code}"
+            if line.count(",") == 4 and '"' not in line and "\n" not in line and "\r" not in line:
+                batch.append(line + "\r\n")   # csv.writer ends lines with \r\n too
+            else:
+                batch.append(writer.writerow(row))
+            if len(batch) >= EXPORT_BATCH_SIZE:
+                yield "".join(batch)
+                batch = []
+        if batch:
+            yield "".join(batch)
 
     # ---------------------------------------------------------------
-    # STEP 6: Return the response
+    # STEP 5: Return a streaming response
     # ---------------------------------------------------------------
-    # At this point, 'response' holds all CSV data in memory.
-    # Django sends it back to the browser, which prompts the user
-    # to download the file automatically.
+    # StreamingHttpResponse sends each line to the browser as soon as it is produced,
+    # so memory use stays flat no matter how many students there are.
+    # The 'content_type' tells the browser what kind of file it is.
+    #   text/csv → browser knows it's a spreadsheet-friendly CSV file.
+    response = StreamingHttpResponse(csv_lines(), content_type="text/csv")
+
+    # This header tells the browser: “Don’t just display this — download it!”
+    # The word 'attachment' triggers a file download prompt.
+    # filename="students_2025-10-12_17-35.csv" sets the default save name.
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
     return response
 
 
 # ===================================================================================================
 # addition/changes: JSON export example
 
+@gzip_page
+@cache_control(no_cache=True)
+@condition(etag_func=students_export_weak_etag, last_modified_func=students_export_last_modified)
 def export_students_json(request):
     """
     Generate and download a JSON file of all students.
@@ -716,44 +1049,59 @@ def export_students_json(request):
     # ---------------------------------------------------------------
     # STEP 1: Prepare data from the database
     # ---------------------------------------------------------------
-    # values() returns dictionaries instead of tuples (perfect for JSON).
-    # select_related("section") allows us to fetch section code efficiently.
-    data = list(
-        Student.objects
-        .select_related("section")
-        .values(
-            "student_id",
-            "first_name",
-            "last_name",
-            "email",
-            "section__code"
-        )
-        .order_by("last_name", "first_name")
-    )
+    # The same rows as the CSV export (get_students_export_rows()), one tuple per student.
+    # Each tuple is turned into a dict with these keys; the section code keeps its
+    # "section__code" key in the file, like the student API does.
+    # Below, iterator(chunk_size=EXPORT_BATCH_SIZE) streams the rows in batches instead of building one big list.
+    keys = ("student_id", "first_name", "last_name", "email", "section__code")
+    rows = get_students_export_rows()
+    # The count was already read with the ETag (no extra COUNT query).
+    record_count = students_export_version(request)["n"]
 
     # ---------------------------------------------------------------
-    # STEP 2: Build a structured JSON dictionary
+    # STEP 2: Build the structured JSON piece by piece
     # ---------------------------------------------------------------
-    # This wraps metadata + actual data.
+    # This wraps metadata + actual data:
+    #   {"generated_at": ..., "record_count": ..., "students": [ ... ]}
     # Makes the file easier to read and parse later if used by APIs.
-    json_content = {
-        "generated_at": datetime.now().isoformat(timespec="seconds"),
-        "record_count": len(data),
-        "students": data,
-    }
+    # We write the opening part, then one student at a time, then the closing part.
+    # Each student is serialized with orjson (much faster than the json module; it
+    # returns bytes). The output is the same indented JSON as json.dumps(..., indent=2).
+    generated_at = datetime.now().isoformat(timespec="seconds")
+
+    def json_chunks():
+        yield (
+            b'{\n  "generated_at": ' + orjson.dumps(generated_at)
+            + b',\n  "record_count": ' + str(record_count).encode()
+            + b',\n  "students": ['
+        )
+        # Like the CSV export, students are sent EXPORT_BATCH_SIZE at a time,
+        # not one tiny chunk each.
+        batch = []     # serialized students waiting to be sent
+        sent = False   # has any student been sent yet? (decides the "," before a batch)
+        for row in rows.iterator(chunk_size=EXPORT_BATCH_SIZE):
+            student = dict(zip(keys, row))
+            # indent the student's own lines by 4 spaces so it sits inside "students": [...]
+            batch.append(b"    " + orjson.dumps(student, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n    "))
+            if len(batch) >= EXPORT_BATCH_SIZE:
+                yield (b",\n" if sent else b"\n") + b",\n".join(batch)
+                batch = []
+                sent = True
+        if batch:
+            yield (b",\n" if sent else b"\n") + b",\n".join(batch)
+            sent = True
+        yield b"\n  ]\n}" if sent else b"]\n}"
 
     # ---------------------------------------------------------------
     # STEP 3: Create the HTTP response
     # ---------------------------------------------------------------
-    # JsonResponse automatically serializes the Python dictionary into JSON text.
-    # It sets content-type = "application/json".
-    response = JsonResponse(json_content, json_dumps_params={"indent": 2})
+    # StreamingHttpResponse sends each piece as soon as it is ready.
+    response = StreamingHttpResponse(json_chunks(), content_type="application/json")
 
     # ---------------------------------------------------------------
-    # STEP 4: Create a timestamp for a unique filename and activate download prompt
+    # STEP 4: Pick the filename (see students_export_filename above) and activate download prompt
     # ---------------------------------------------------------------
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
-    filename = f"students_{timestamp}.json"
+    filename = students_export_filename(request, "json")
 
     # This header tells the browser: “download this instead of just showing it”.
     response["Content-Disposition"] = f'attachment; filename="{filename}"'